@@ -18,10 +18,17 @@ import matplotlib.colors as mcolors
 
 
 from circuit_model import OntologyBuilderUnified, simulate_circuit
-from constants import COMPONENT_CONSTANTS
+from constants import COMPONENT_CONSTANTS, DERIVED_KEYS
 
 last_simulation_export_data = None
 
+def editable_constants():
+    """Copy COMPONENT_CONSTANTS into plain per-component dicts, minus derived keys"""
+    return {
+        name: {key: value for key, value in params.items() if key not in DERIVED_KEYS}
+        for name, params in COMPONENT_CONSTANTS.items()
+    }
+
 def generate_equation_display(builder, result):
     """Generate human-readable equation representations for each protein"""
     equations = {}
@@ -328,9 +335,11 @@ def simulate():
             }), 400
         
         # Apply dial adjustments to constants if provided
-        # IMPORTANT: Use deep copy to avoid modifying the original constants
-        import copy
-        adjusted_constants = copy.deepcopy(COMPONENT_CONSTANTS)
+        # IMPORTANT: Copy every entry to avoid modifying the original constants.
+        # Entries with identical parameters share one read-only mapping, so a
+        # deep copy would keep them aliased (and cannot copy a mappingproxy).
+        # Derived keys such as Kn are dropped, as overrides below would leave them stale.
+        adjusted_constants = editable_constants()
         
         # Process dial parameters for component-specific overrides
         if dial_data:
@@ -1060,7 +1069,7 @@ def export_script():
 @app.route('/api/constants')
 def get_constants():
     """Get current component constants for dial mode"""
-    return jsonify(COMPONENT_CONSTANTS)
+    return jsonify(editable_constants())
 
 @app.route('/api/parameter_defaults')
 def get_parameter_defaults():
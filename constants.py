@@ -3,215 +3,211 @@ Enhanced component constants for genetic circuit modeling
 Based on realistic biological parameters from Version 15.3
 """
 
-COMPONENT_CONSTANTS = {
-    # Promoters - From working notebook constants
-    "promoter_1": {"strength": 5.0, "type": "promoter"},
-    "promoter_2": {"strength": 5.0, "type": "promoter"},
-    "promoter_3": {"strength": 5.0, "type": "promoter"},
-    "promoter_4": {"strength": 5.0, "type": "promoter"},
-    "promoter_5": {"strength": 5.0, "type": "promoter"},
-    "promoter_6": {"strength": 5.0, "type": "promoter"},
-    "promoter_7": {"strength": 5.0, "type": "promoter"},
-    "promoter_8": {"strength": 5.0, "type": "promoter"},
-    "promoter_9": {"strength": 5.0, "type": "promoter"},
-    "promoter_10": {"strength": 5.0, "type": "promoter"},
-    "promoter_11": {"strength": 5.0, "type": "promoter"},
-    "promoter_12": {"strength": 5.0, "type": "promoter"},
-    "promoter_13": {"strength": 5.0, "type": "promoter"},
-    "promoter_14": {"strength": 5.0, "type": "promoter"},
-    "promoter_15": {"strength": 5.0, "type": "promoter"},
-    
-    # RBS - From working notebook constants
-    "rbs_1": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_2": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_3": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_4": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_5": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_6": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_7": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_8": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_9": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_10": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_11": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_12": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_13": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_14": {"efficiency": 1.0, "type": "rbs"},
-    "rbs_15": {"efficiency": 1.0, "type": "rbs"},
-    
-    # CDS - From working notebook constants
-    "cds_1": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_2": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_3": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_4": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_5": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_6": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_7": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_8": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_9": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_10": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_11": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_12": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_13": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_14": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    "cds_15": {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0, "type": "cds"},
-    
-    # Terminators - From working notebook constants  
-    "terminator_1": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_2": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_3": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_4": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_5": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_6": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_7": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_8": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_9": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_10": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_11": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_12": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_13": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_14": {"efficiency": 0.99, "type": "terminator"},
-    "terminator_15": {"efficiency": 0.99, "type": "terminator"},
-    
+import hashlib
+import importlib.util
+import operator
+import os
+import sys
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Mapping, NamedTuple, Optional
+
+import numpy as np
+
+__all__ = (
+    "COMPONENT_CONSTANTS",
+    "PARAMETER_RANGES",
+    "TYPE_CODES",
+    "DERIVED_KEYS",
+    "NAME_TO_IDX",
+    "ComponentId",
+    "KR",
+    "KA",
+    "KN",
+    "N_HILL",
+    "STRENGTH",
+    "EFFICIENCY",
+    "DEG_RATE",
+    "TRANS_RATE",
+    "INIT_CONC",
+    "CONCENTRATION",
+    "IS_FLOATING",
+    "TYPE_CODE",
+    "KR_F32",
+    "KA_F32",
+    "KN_F32",
+    "N_HILL_I8",
+    "IS_FLOATING_BOOL",
+    "PROMOTER_STRENGTH_TUP",
+    "RBS_EFFICIENCY_TUP",
+    "CDS_TRANS_TUP",
+    "CDS_DEG_TUP",
+    "CDS_INIT_TUP",
+    "TERMINATOR_EFFICIENCY_TUP",
+    "REPRESSOR_KR_TUP",
+    "REPRESSOR_KN_TUP",
+    "ACTIVATOR_KA_TUP",
+    "ACTIVATOR_KN_TUP",
+    "INDUCER_KA_TUP",
+    "INDUCER_KN_TUP",
+    "INHIBITOR_KR_TUP",
+    "INHIBITOR_KN_TUP",
+    "CONSTANTS_HASH",
+    "Promoter",
+    "RBS",
+    "CDS",
+    "Terminator",
+    "Repressor",
+    "Activator",
+    "Inducer",
+    "Inhibitor",
+    "RECORD_TYPES",
+    "COMPONENT_RECORDS",
+    "HILL_N_FIXED",
+    "HILL_LUT_SIZE",
+    "HILL_X_MIN",
+    "HILL_X_MAX",
+    "HILL_X_GRID",
+    "KR_LUT_PARAMS",
+    "KR_HILL_LUT",
+    "KR_LUT_IDX",
+    "KA_LUT_PARAMS",
+    "KA_HILL_LUT",
+    "KA_LUT_IDX",
+    "UNIQUE_KR",
+    "UNIQUE_KA",
+    "PARAM_NAMES",
+    "PARAM_IDX",
+    "PARAM_LO",
+    "PARAM_HI",
+    "PARAMETER_SCALES",
+    "PARAM_IS_LOGSCALE",
+    "PARAM_LO_LOG",
+    "PARAM_HI_LOG",
+    "sample_parameters",
+    "render_component_expr",
+    "render_rhs_source",
+    "build_rhs",
+    "RHS_LUT_MAX_REGULATORS",
+    "RHS_LUT_DTYPE",
+    "build_rhs_lut",
+    "eval_rhs_lut",
+    "get_numba_table",
+)
+
+# Integer type codes, stored in each entry as "type_id" alongside the "type"
+# string so hot code can dispatch on a small int instead of comparing strings.
+TYPE_CODES = {
+    "promoter": 0,
+    "rbs": 1,
+    "cds": 2,
+    "terminator": 3,
+    "repressor": 4,
+    "activator": 5,
+    "inducer": 6,
+    "inhibitor": 7,
+}
+
+
+# Entry keys computed from the others rather than set by the user. Editable
+# copies (e.g. app.py's dial-mode table) should leave these out.
+DERIVED_KEYS = frozenset({"Kn", "type_id"})
+
+
+def _entry(comp_type, params):
+    """Freeze one canonical parameter set, tagging its type and type code."""
+    return MappingProxyType({**params, "type": comp_type, "type_id": TYPE_CODES[comp_type]})
+
+
+# Canonical parameter sets. Components with identical parameters share one
+# read-only instance, so the table holds a few dozen objects rather
+# than one dict per component; copy an entry before modifying it.
+_PROMOTER = _entry("promoter", {"strength": 5.0})
+_RBS = _entry("rbs", {"efficiency": 1.0})
+_CDS = _entry("cds", {"degradation_rate": 1.0, "translation_rate": 7.0, "init_conc": 0.0})
+_TERM = _entry("terminator", {"efficiency": 0.99})
+
+
+# Every regulator uses a Hill coefficient of 2, and the generated and
+# table-driven right-hand sides below rely on it to evaluate x**n as x*x.
+# Changing it means updating those Hill kernels as well.
+HILL_N_FIXED: Final[int] = 2
+
+
+def _regulator(comp_type, K_name, K, is_floating=False, concentration=None):
+    """Canonical regulator parameters, n = HILL_N_FIXED, with Kn = K**n precomputed.
+
+    Kn is derived: anything overriding K or n on a copy must recompute it.
+    """
+    params = {K_name: K, "n": HILL_N_FIXED, "Kn": K ** HILL_N_FIXED}
+    if concentration is not None:
+        params["concentration"] = concentration
+    params["is_floating"] = is_floating
+    return _entry(comp_type, params)
+
+
+# Kr per repressor index; every index not listed uses the default
+_REPRESSOR_KR = {2: 0.1, 3: 0.4}
+_DEFAULT_REPRESSOR_KR = 0.5
+
+_REPRESSOR = {
+    Kr: _regulator("repressor", "Kr", Kr)
+    for Kr in {_DEFAULT_REPRESSOR_KR, *_REPRESSOR_KR.values()}
+}
+_ACTIVATOR = _regulator("activator", "Ka", 0.4)
+_INDUCER = _regulator("inducer", "Ka", 0.5)
+_INHIBITOR = _regulator("inhibitor", "Kr", 0.5)
+_FLOATING_INHIBITOR = _regulator("inhibitor", "Kr", 0.5, is_floating=True, concentration=1.0)
+_FLOATING_INDUCER = _regulator("inducer", "Ka", 0.5, is_floating=True, concentration=1.0)
+
+_INDICES = range(1, 16)
+
+
+def _numbered(prefix, entry):
+    """Name entries {prefix}_1 .. {prefix}_15, all sharing one entry."""
+    return {f"{prefix}_{i}": entry for i in _INDICES}
+
+
+def _paired(prefix, entry_for):
+    """Name {prefix}_{i}_start / _end pairs, taking index i's entry from entry_for(i)."""
+    return {f"{prefix}_{i}_{end}": entry_for(i) for i in _INDICES for end in ("start", "end")}
+
+
+# Component name -> interned parameter mapping. Every view below is built from
+# this, including the public COMPONENT_CONSTANTS table.
+_COMPONENT_ENTRIES = {
+    # Promoters, RBS, CDS, terminators - From working notebook constants
+    **_numbered("promoter", _PROMOTER),
+    **_numbered("rbs", _RBS),
+    **_numbered("cds", _CDS),
+    **_numbered("terminator", _TERM),
+
     # Software format: repressor_start_1, repressor_start_2, etc.
-    
-    # Hardware format: repressor_a_start, repressor_b_start, etc.
-    "repressor_1_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_1_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_2_start": {"Kr": 0.1, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_2_end": {"Kr": 0.1, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_3_start": {"Kr": 0.4, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_3_end": {"Kr": 0.4, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_4_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_4_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_5_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_5_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_6_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_6_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_7_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_7_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_8_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_8_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_9_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_9_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_10_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_10_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_11_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_11_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_12_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_12_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_13_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_13_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_14_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_14_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_15_start": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    "repressor_15_end": {"Kr": 0.5, "n": 2, "type": "repressor", "is_floating": False},
-    
-    
-    # Hardware format: activator_a_start, activator_b_start, etc.
-    "activator_1_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_1_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_2_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_2_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_3_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_3_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_4_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_4_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_5_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_5_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_6_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_6_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_7_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_7_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_8_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_8_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_9_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_9_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_10_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_10_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_11_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_11_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_12_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_12_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_13_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_13_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_14_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_14_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_15_start": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-    "activator_15_end": {"Ka": 0.4, "n": 2, "type": "activator", "is_floating": False},
-
-    # Hardware format: inducer_a_start, inducer_b_start, etc.
-    "inducer_1_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_1_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_2_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_2_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_3_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_3_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_4_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_4_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_5_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_5_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_6_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_6_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_7_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_7_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_8_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_8_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_9_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_9_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_10_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_10_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_11_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_11_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_12_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_12_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_13_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_13_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_14_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_14_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_15_start": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-    "inducer_15_end": {"Ka": 0.5, "n": 2, "type": "inducer", "is_floating": False},
-
-    # Hardware format: inhibitor_a_start, inhibitor_b_start, etc.
-    "inhibitor_1_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_1_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_2_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_2_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_3_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_3_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_4_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_4_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_5_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_5_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_6_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_6_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_7_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_7_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_8_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_8_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_9_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_9_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_10_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_10_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_11_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_11_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_12_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_12_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_13_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_13_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_14_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_14_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_15_start": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    "inhibitor_15_end": {"Kr": 0.5, "n": 2, "type": "inhibitor", "is_floating": False},
-    
+    # Hardware format: repressor_a_start, activator_a_start, etc.
+    **_paired("repressor", lambda i: _REPRESSOR[_REPRESSOR_KR.get(i, _DEFAULT_REPRESSOR_KR)]),
+    **_paired("activator", lambda i: _ACTIVATOR),
+    **_paired("inducer", lambda i: _INDUCER),
+    **_paired("inhibitor", lambda i: _INHIBITOR),
+
     # Floating regulators - From working notebook constants
-    "floating_inhibitor_a": {"Kr": 0.5, "n": 2, "concentration": 1.0, "type": "inhibitor", "is_floating": True},
-    "floating_inhibitor_b": {"Kr": 0.5, "n": 2, "concentration": 1.0, "type": "inhibitor", "is_floating": True},
-    "floating_inhibitor_c": {"Kr": 0.5, "n": 2, "concentration": 1.0, "type": "inhibitor", "is_floating": True},
-    "floating_inducer_a": {"Ka": 0.5, "n": 2, "concentration": 1.0, "type": "inducer", "is_floating": True},
-    "floating_inducer_b": {"Ka": 0.5, "n": 2, "concentration": 1.0, "type": "inducer", "is_floating": True},
-    "floating_inducer_c": {"Ka": 0.5, "n": 2, "concentration": 1.0, "type": "inducer", "is_floating": True}
+    **{f"floating_inhibitor_{s}": _FLOATING_INHIBITOR for s in "abc"},
+    **{f"floating_inducer_{s}": _FLOATING_INDUCER for s in "abc"},
 }
 
+# Guard against entries added without _regulator: every n must be HILL_N_FIXED.
+if any(params.get("n", HILL_N_FIXED) != HILL_N_FIXED for params in _COMPONENT_ENTRIES.values()):
+    raise ValueError(f"Hill n must be {HILL_N_FIXED}; update the Hill kernels if changing it")
+
+# COMPONENT_CONSTANTS, the original name -> parameter mapping table, stays
+# available for existing callers (app.py copies and adjusts it for dial mode).
+# It is a read-only proxy over _COMPONENT_ENTRIES, so no table is copied.
+# Deprecated for simulation code: hot paths use NAME_TO_IDX and the arrays
+# below (k = KR[NAME_TO_IDX[name]]) instead of per-call dict lookups. No
+# DeprecationWarning is emitted, since app.py reads it on every request and
+# that use is supported.
+COMPONENT_CONSTANTS: Final[Mapping[str, Mapping[str, object]]] = MappingProxyType(_COMPONENT_ENTRIES)
+
 # Parameter ranges for dial mode
 PARAMETER_RANGES = {
     "strength": (0.1, 5.0),
@@ -227,3 +223,602 @@ PARAMETER_RANGES = {
     "temperature_factor": (0.5, 2.0),
     "resource_availability": (0.1, 2.0)
 }
+
+# PARAMETER_RANGES as parallel arrays, so a whole parameter vector (or an
+# (N, len(PARAM_NAMES)) sample matrix) clips in one np.clip(x, PARAM_LO, PARAM_HI)
+PARAM_NAMES = tuple(PARAMETER_RANGES)
+PARAM_IDX = {name: i for i, name in enumerate(PARAM_NAMES)}
+_PARAM_BOUNDS = np.array(list(PARAMETER_RANGES.values()), dtype=np.float64)
+PARAM_LO = _PARAM_BOUNDS[:, 0].copy()
+PARAM_HI = _PARAM_BOUNDS[:, 1].copy()
+
+# Sampling scale per dial parameter. Ranges spanning two decades are sampled
+# uniformly in log space; everything else is sampled linearly.
+PARAMETER_SCALES = {
+    "degradation_rate": "log",
+    "binding_affinity": "log",
+}
+PARAM_IS_LOGSCALE = np.array(
+    [PARAMETER_SCALES.get(name, "linear") == "log" for name in PARAM_NAMES]
+)
+PARAM_LO_LOG = np.log(PARAM_LO)
+PARAM_HI_LOG = np.log(PARAM_HI)
+
+
+def sample_parameters(rng, n):
+    """Draw an (n, len(PARAM_NAMES)) matrix of dial parameters within range.
+
+    rng is a np.random.Generator; columns follow PARAM_NAMES.
+    """
+    u = rng.random((n, len(PARAM_NAMES)))
+    return np.where(
+        PARAM_IS_LOGSCALE,
+        np.exp(PARAM_LO_LOG + u * (PARAM_HI_LOG - PARAM_LO_LOG)),
+        PARAM_LO + u * (PARAM_HI - PARAM_LO),
+    )
+
+
+# Flat (structure-of-arrays) view of the component table for ODE right-hand sides.
+# Resolve a name once with NAME_TO_IDX (or ComponentId), then read KR[i],
+# N_HILL[i], ... in the hot loop. Parameters a component does not define are NaN.
+NAME_TO_IDX = {name: i for i, name in enumerate(_COMPONENT_ENTRIES)}
+
+# Integer component ids, e.g. KR[ComponentId.repressor_2_start]. Resolve names
+# once with ComponentId[name] when a circuit is parsed; members equal NAME_TO_IDX.
+ComponentId = IntEnum("ComponentId", list(_COMPONENT_ENTRIES), start=0)
+
+
+def _param_array(key):
+    """Gather one parameter across all components into a float64 array."""
+    arr = np.full(len(_COMPONENT_ENTRIES), np.nan, dtype=np.float64)
+    for i, params in enumerate(_COMPONENT_ENTRIES.values()):
+        if key in params:
+            arr[i] = params[key]
+    return arr
+
+
+KR = _param_array("Kr")
+KA = _param_array("Ka")
+N_HILL = _param_array("n")
+KN = _param_array("Kn")
+STRENGTH = _param_array("strength")
+EFFICIENCY = _param_array("efficiency")
+DEG_RATE = _param_array("degradation_rate")
+TRANS_RATE = _param_array("translation_rate")
+INIT_CONC = _param_array("init_conc")
+CONCENTRATION = _param_array("concentration")
+IS_FLOATING = _param_array("is_floating")
+TYPE_CODE = np.array(
+    [params["type_id"] for params in _COMPONENT_ENTRIES.values()], dtype=np.int8
+)
+
+# Narrow copies for GPU / SIMD kernels, which fit twice as many float32 lanes
+# per cache line. CPU right-hand sides keep using the float64 arrays above.
+# N_HILL_I8 is 0 for components without a Hill coefficient.
+KR_F32 = KR.astype(np.float32)
+KA_F32 = KA.astype(np.float32)
+KN_F32 = KN.astype(np.float32)
+N_HILL_I8 = np.nan_to_num(N_HILL, nan=0.0).astype(np.int8)
+IS_FLOATING_BOOL = IS_FLOATING == 1.0
+
+
+# Per-group parameters as plain tuples ordered by component index 1..15, e.g.
+# REPRESSOR_KR_TUP[1] is the Kr of repressor_2_start / repressor_2_end (both
+# ends of a regulator share parameters). numba treats a captured tuple as a
+# compile-time constant, so generated @njit code can close over these.
+def _group_tuple(pattern, key):
+    """Collect one parameter of components pattern.format(1) .. pattern.format(15)."""
+    return tuple(_COMPONENT_ENTRIES[pattern.format(i)][key] for i in _INDICES)
+
+
+PROMOTER_STRENGTH_TUP = _group_tuple("promoter_{}", "strength")
+RBS_EFFICIENCY_TUP = _group_tuple("rbs_{}", "efficiency")
+CDS_TRANS_TUP = _group_tuple("cds_{}", "translation_rate")
+CDS_DEG_TUP = _group_tuple("cds_{}", "degradation_rate")
+CDS_INIT_TUP = _group_tuple("cds_{}", "init_conc")
+TERMINATOR_EFFICIENCY_TUP = _group_tuple("terminator_{}", "efficiency")
+REPRESSOR_KR_TUP = _group_tuple("repressor_{}_start", "Kr")
+REPRESSOR_KN_TUP = _group_tuple("repressor_{}_start", "Kn")
+ACTIVATOR_KA_TUP = _group_tuple("activator_{}_start", "Ka")
+ACTIVATOR_KN_TUP = _group_tuple("activator_{}_start", "Kn")
+INDUCER_KA_TUP = _group_tuple("inducer_{}_start", "Ka")
+INDUCER_KN_TUP = _group_tuple("inducer_{}_start", "Kn")
+INHIBITOR_KR_TUP = _group_tuple("inhibitor_{}_start", "Kr")
+INHIBITOR_KN_TUP = _group_tuple("inhibitor_{}_start", "Kn")
+
+# The same columns packed row-wise into one structured array, for code that
+# walks a component's parameters together: _TABLE[NAME_TO_IDX[name]]["Kr"].
+# Float fields a component does not define are NaN; n is 0 for non-regulators.
+# The float64 fields come first and the dtype is aligned, so every float64 is
+# 8-byte aligned; rows are padded to 80 bytes and do not map one-to-one onto
+# 64-byte cache lines.
+_TABLE_DTYPE = np.dtype([
+    ("Kr", "f8"),
+    ("Ka", "f8"),
+    ("Kn", "f8"),
+    ("strength", "f8"),
+    ("efficiency", "f8"),
+    ("deg", "f8"),
+    ("trans", "f8"),
+    ("init", "f8"),
+    ("conc", "f8"),
+    ("n", "i1"),
+    ("is_floating", "?"),
+    ("type_id", "i1"),
+], align=True)
+
+
+def _pack_table():
+    """Pack the per-parameter arrays into one _TABLE_DTYPE row per component."""
+    table = np.zeros(len(NAME_TO_IDX), dtype=_TABLE_DTYPE)
+    for field, column in (
+        ("Kr", KR),
+        ("Ka", KA),
+        ("Kn", KN),
+        ("strength", STRENGTH),
+        ("efficiency", EFFICIENCY),
+        ("deg", DEG_RATE),
+        ("trans", TRANS_RATE),
+        ("init", INIT_CONC),
+        ("conc", CONCENTRATION),
+        ("n", N_HILL_I8),
+        ("is_floating", IS_FLOATING_BOOL),
+        ("type_id", TYPE_CODE),
+    ):
+        table[field] = column
+    return table
+
+
+_TABLE = _pack_table()
+
+# Fingerprint of the table contents. The RHS disk cache lives in a directory
+# named after it, so each table version compiles into its own directory.
+CONSTANTS_HASH = hashlib.blake2b(
+    "\0".join(NAME_TO_IDX).encode() + _TABLE.tobytes()
+).hexdigest()[:16]
+
+
+# Immutable, attribute-access records mirroring the component table, one
+# NamedTuple type per component type: COMPONENT_RECORDS["repressor_2_start"].Kr
+class Promoter(NamedTuple):
+    strength: float
+
+
+class RBS(NamedTuple):
+    efficiency: float
+
+
+class CDS(NamedTuple):
+    degradation_rate: float
+    translation_rate: float
+    init_conc: float
+
+
+class Terminator(NamedTuple):
+    efficiency: float
+
+
+class Repressor(NamedTuple):
+    Kr: float
+    n: int
+    Kn: float
+    is_floating: bool
+    concentration: Optional[float] = None
+
+
+class Activator(NamedTuple):
+    Ka: float
+    n: int
+    Kn: float
+    is_floating: bool
+    concentration: Optional[float] = None
+
+
+class Inducer(NamedTuple):
+    Ka: float
+    n: int
+    Kn: float
+    is_floating: bool
+    concentration: Optional[float] = None
+
+
+class Inhibitor(NamedTuple):
+    Kr: float
+    n: int
+    Kn: float
+    is_floating: bool
+    concentration: Optional[float] = None
+
+
+RECORD_TYPES = {
+    "promoter": Promoter,
+    "rbs": RBS,
+    "cds": CDS,
+    "terminator": Terminator,
+    "repressor": Repressor,
+    "activator": Activator,
+    "inducer": Inducer,
+    "inhibitor": Inhibitor,
+}
+
+
+def _make_record(params):
+    """Build the NamedTuple record for one component entry."""
+    record_type = RECORD_TYPES[params["type"]]
+    return record_type(**{f: params[f] for f in record_type._fields if f in params})
+
+
+COMPONENT_RECORDS = MappingProxyType(
+    {name: _make_record(params) for name, params in _COMPONENT_ENTRIES.items()}
+)
+
+
+# Hill-function lookup tables. Regulators share only a handful of distinct
+# (K, n) pairs, so x**n / (K**n + x**n) is tabulated once per pair;
+# KR_LUT_IDX / KA_LUT_IDX map each component to its row (-1 where the
+# component has no Kr / Ka). The repression form K**n / (K**n + x**n) is 1
+# minus the tabulated value. The grid is log-spaced from HILL_X_MIN (well below
+# the smallest K) to HILL_X_MAX, the highest steady state the table's own
+# parameters allow (max kprod / min degradation rate), so interpolating a row
+# in log(x) keeps a small relative error even where x << K. The tables are data
+# only: outside the grid, and on any hot path, x*x / (Kn + x*x) is both exact
+# and cheaper than an interpolation.
+HILL_LUT_SIZE = 4096
+HILL_X_MIN = 1e-3 * float(min(np.nanmin(KR), np.nanmin(KA)))
+HILL_X_MAX = float(
+    np.nanmax(STRENGTH)
+    * np.nanmax(EFFICIENCY[TYPE_CODE == TYPE_CODES["rbs"]])
+    * np.nanmax(TRANS_RATE)
+    / np.nanmin(DEG_RATE)
+)
+HILL_X_GRID = np.geomspace(HILL_X_MIN, HILL_X_MAX, HILL_LUT_SIZE)
+
+
+def _hill_lut(K):
+    """Tabulate the Hill curve for each unique (K, n) pair present in K."""
+    mask = ~np.isnan(K)
+    params, inverse = np.unique(
+        np.column_stack((K[mask], N_HILL[mask])), axis=0, return_inverse=True
+    )
+    lut_idx = np.full(len(K), -1, dtype=np.int8)
+    lut_idx[mask] = inverse.reshape(-1)
+    x_n = HILL_X_GRID[np.newaxis, :] ** params[:, 1:2]
+    lut = x_n / (params[:, 0:1] ** params[:, 1:2] + x_n)
+    return params, lut, lut_idx
+
+
+KR_LUT_PARAMS, KR_HILL_LUT, KR_LUT_IDX = _hill_lut(KR)
+KA_LUT_PARAMS, KA_HILL_LUT, KA_LUT_IDX = _hill_lut(KA)
+UNIQUE_KR = KR_LUT_PARAMS[:, 0]
+UNIQUE_KA = KA_LUT_PARAMS[:, 0]
+
+
+# Specialized ODE right-hand sides. A circuit topology is a sequence of species,
+# one per CDS, each a mapping with "promoter", "rbs", "cds", optional
+# "terminator" and optional "regulators": a sequence of
+# (regulator_name, source) pairs where source is the index of the regulating
+# species, or None for a floating regulator held at its table concentration.
+# Each species follows dy/dt = kprod * prod(hill terms) - degradation * y with
+# kprod = strength * rbs efficiency * translation rate * terminator efficiency,
+# as in circuit_model.simulate_circuit.
+_RHS_CACHE = {}
+
+
+@lru_cache(maxsize=None)
+def _load_njit():
+    """Import numba.njit on first use; None when numba is not installed.
+
+    numba is optional and slow to import, so `import constants` never pulls
+    it in; only the functions that compile code do.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit
+
+
+def render_component_expr(name, var):
+    """Render the Hill term of regulator `name` on `var` as Python source.
+
+    Table values are baked in as literals, e.g. "(x*x)/(0.25 + x*x)" for
+    an activator with Kn=0.5**2; repressors and inhibitors render the repression
+    form "0.25/(0.25 + x*x)". n is HILL_N_FIXED, so x**n is emitted as x*x.
+    """
+    params = _COMPONENT_ENTRIES[name]
+    comp_type = params["type"]
+    if comp_type in ("repressor", "inhibitor"):
+        repressing = True
+    elif comp_type in ("activator", "inducer"):
+        repressing = False
+    else:
+        raise ValueError(f"{name} is a {comp_type}, not a regulator")
+    k_n = repr(float(params["Kn"]))
+    x_n = f"{var}*{var}"
+    if repressing:
+        return f"{k_n}/({k_n} + {x_n})"
+    return f"({x_n})/({k_n} + {x_n})"
+
+
+def _topology_component(name, comp_types, role):
+    """Look up a topology slot's entry, checking it is one of comp_types."""
+    if not isinstance(name, str):
+        raise ValueError(f"{role} must be a component name, got {name!r}")
+    params = _COMPONENT_ENTRIES.get(name)
+    if params is None:
+        raise ValueError(f"unknown {role} {name!r}")
+    if params["type"] not in comp_types:
+        raise ValueError(f"{name} is a {params['type']}, not a {role}")
+    return params
+
+
+def _topology_key(circuit_topology):
+    """Validate a topology and normalize it into a hashable tuple."""
+    species_list = list(circuit_topology)
+    key = []
+    for i, species in enumerate(species_list):
+        promoter, rbs, cds = species.get("promoter"), species.get("rbs"), species.get("cds")
+        _topology_component(promoter, ("promoter",), "promoter")
+        _topology_component(rbs, ("rbs",), "rbs")
+        _topology_component(cds, ("cds",), "cds")
+        terminator = species.get("terminator")
+        if terminator is not None:
+            _topology_component(terminator, ("terminator",), "terminator")
+        regulators = []
+        for reg, src in species.get("regulators", ()):
+            params = _topology_component(
+                reg, ("repressor", "activator", "inducer", "inhibitor"), "regulator"
+            )
+            if src is None:
+                if "concentration" not in params:
+                    raise ValueError(f"regulator {reg} of species {i} needs a source species")
+            else:
+                try:
+                    index = operator.index(src)
+                except TypeError:
+                    index = -1
+                if not 0 <= index < len(species_list):
+                    raise ValueError(f"regulator {reg} of species {i} has invalid source {src!r}")
+                src = index
+            regulators.append((reg, src))
+        key.append((promoter, rbs, cds, terminator, tuple(regulators)))
+    return tuple(key)
+
+
+def _species_kprod(promoter, rbs, cds, terminator):
+    """Unregulated production rate of one species."""
+    return (
+        _COMPONENT_ENTRIES[promoter]["strength"]
+        * _COMPONENT_ENTRIES[rbs]["efficiency"]
+        * _COMPONENT_ENTRIES[cds]["translation_rate"]
+        * (_COMPONENT_ENTRIES[terminator]["efficiency"] if terminator else 1.0)
+    )
+
+
+def render_rhs_source(circuit_topology):
+    """Render the source of `def rhs(t, y)` for a circuit topology."""
+    key = _topology_key(circuit_topology)
+    lines = ["def rhs(t, y):", f"    dydt = np.empty({len(key)})"]
+    for i, (promoter, rbs, cds, terminator, regulators) in enumerate(key):
+        terms = [repr(float(_species_kprod(promoter, rbs, cds, terminator)))]
+        for reg, src in regulators:
+            if src is None:
+                var = repr(float(_COMPONENT_ENTRIES[reg]["concentration"]))
+            else:
+                var = f"y[{src}]"
+            terms.append(f"({render_component_expr(reg, var)})")
+        deg = repr(float(_COMPONENT_ENTRIES[cds]["degradation_rate"]))
+        lines.append(f"    dydt[{i}] = {' * '.join(terms)} - {deg} * y[{i}]")
+    lines.append("    return dydt")
+    return "\n".join(lines) + "\n"
+
+
+_RHS_SIGNATURE = "float64[:](float64, float64[:])"
+
+
+def _rhs_cache_dir():
+    """Directory holding generated RHS modules and numba's compiled code for them."""
+    root = os.environ.get("MAGIC_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".magic_cache"))
+    return os.path.join(root, f"rhs_{CONSTANTS_HASH}")
+
+
+def _load_cached_rhs(circuit_topology):
+    """Write the RHS as a module under _rhs_cache_dir() and import it.
+
+    numba can only disk-cache functions defined in a real source file, so the
+    generated code is written out and compiled with @njit(cache=True); later
+    processes reuse the compiled code instead of running LLVM again. The
+    directory is keyed on CONSTANTS_HASH, so editing the table starts a fresh
+    one and directories left by older table versions can be deleted at any
+    time; within it the module name hashes the generated source, so each
+    distinct topology gets one small .py file (plus numba's cache files).
+
+    The signature is given up front so numba compiles (or loads from its
+    cache) while the module is registered in sys.modules; the entry is then
+    removed, so loaded modules do not accumulate there.
+    """
+    source = (
+        "import numpy as np\n"
+        "from numba import njit\n\n\n"
+        f'@njit("{_RHS_SIGNATURE}", fastmath=True, cache=True)\n'
+        + render_rhs_source(circuit_topology)
+    )
+    module_name = f"rhs_{hashlib.blake2b(source.encode()).hexdigest()[:16]}"
+    cache_dir = _rhs_cache_dir()
+    path = os.path.join(cache_dir, f"{module_name}.py")
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(source)
+        os.replace(tmp_path, path)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    # numba's cache re-imports the module by name when loading compiled code
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Do not leave a module behind that failed to compile
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        raise
+    finally:
+        del sys.modules[module_name]
+    return module.rhs
+
+
+def build_rhs(circuit_topology):
+    """Compile a specialized `rhs(t, y)` for a circuit topology.
+
+    The result is cached per topology for the life of the process, so repeat
+    solves of the same circuit skip code generation. When numba is installed
+    the function is njit-compiled for rhs(float, float64 array) and its
+    machine code cached on disk under MAGIC_CACHE_DIR (default ~/.magic_cache).
+    Every path takes the same inputs: t is converted to float and y to a
+    contiguous float64 array before the call. The underlying (possibly
+    compiled) function is available as `rhs.compiled`.
+    """
+    key = _topology_key(circuit_topology)
+    rhs = _RHS_CACHE.get(key)
+    if rhs is None:
+        njit = _load_njit()
+        if njit is not None:
+            try:
+                compiled = _load_cached_rhs(circuit_topology)
+            except OSError:
+                compiled = njit(_RHS_SIGNATURE, fastmath=True)(_exec_rhs(circuit_topology))
+        else:
+            compiled = _exec_rhs(circuit_topology)
+
+        def rhs(t, y):
+            return compiled(float(t), np.ascontiguousarray(y, dtype=np.float64))
+
+        rhs.compiled = compiled
+        _RHS_CACHE[key] = rhs
+    return rhs
+
+
+def _exec_rhs(circuit_topology):
+    """Define the generated RHS in memory, without a backing file."""
+    namespace = {"np": np}
+    exec(render_rhs_source(circuit_topology), namespace)
+    return namespace["rhs"]
+
+
+# Table-driven alternative to the generated RHS: build_rhs_lut packs one
+# 64-byte row (a single cache line) per species, so eval_rhs_lut makes one
+# sequential pass over contiguous memory. Floating regulators are constant, so
+# their Hill factors are folded into kprod; up to RHS_LUT_MAX_REGULATORS
+# species-driven regulators fit in a row.
+RHS_LUT_MAX_REGULATORS = 3
+RHS_LUT_DTYPE = np.dtype({
+    "names": ["kprod", "deg", "reg_kn", "reg_src", "reg_type", "n_regs"],
+    "formats": ["f8", "f8", ("f8", 3), ("i4", 3), ("i1", 3), "i1"],
+    "offsets": [0, 8, 16, 40, 52, 55],
+    "itemsize": 64,
+})
+_REPRESSOR_ID = TYPE_CODES["repressor"]
+_INHIBITOR_ID = TYPE_CODES["inhibitor"]
+
+
+def _aligned_zeros(n, dtype, alignment=64):
+    """Zeroed 1-D array of n dtype items whose data starts on an alignment boundary."""
+    buf = np.zeros(n * dtype.itemsize + alignment, dtype=np.uint8)
+    offset = -buf.ctypes.data % alignment
+    return buf[offset:offset + n * dtype.itemsize].view(dtype)
+
+
+def _hill_value(params, x):
+    """Evaluate a regulator's Hill factor at a fixed concentration x."""
+    x_n = x * x
+    if params["type_id"] in (_REPRESSOR_ID, _INHIBITOR_ID):
+        return params["Kn"] / (params["Kn"] + x_n)
+    return x_n / (params["Kn"] + x_n)
+
+
+def build_rhs_lut(circuit_topology):
+    """Pack a circuit topology into a 64-byte-aligned RHS_LUT_DTYPE array."""
+    key = _topology_key(circuit_topology)
+    lut = _aligned_zeros(len(key), RHS_LUT_DTYPE)
+    for i, (promoter, rbs, cds, terminator, regulators) in enumerate(key):
+        kprod = _species_kprod(promoter, rbs, cds, terminator)
+        slot = 0
+        for reg, src in regulators:
+            params = _COMPONENT_ENTRIES[reg]
+            if src is None:
+                kprod *= _hill_value(params, params["concentration"])
+                continue
+            if slot == RHS_LUT_MAX_REGULATORS:
+                raise ValueError(
+                    f"species {i} has more than {RHS_LUT_MAX_REGULATORS} regulating species"
+                )
+            lut["reg_kn"][i, slot] = params["Kn"]
+            lut["reg_src"][i, slot] = src
+            lut["reg_type"][i, slot] = params["type_id"]
+            slot += 1
+        lut["kprod"][i] = kprod
+        lut["deg"][i] = _COMPONENT_ENTRIES[cds]["degradation_rate"]
+        lut["n_regs"][i] = slot
+    return lut
+
+
+_EVAL_RHS_LUT = None
+
+
+def eval_rhs_lut(lut, y):
+    """Evaluate dy/dt for a build_rhs_lut table.
+
+    njit-compiled with fastmath when numba is installed, like build_rhs.
+    """
+    global _EVAL_RHS_LUT
+    if _EVAL_RHS_LUT is None:
+        njit = _load_njit()
+        _EVAL_RHS_LUT = _eval_rhs_lut if njit is None else njit(fastmath=True)(_eval_rhs_lut)
+    return _EVAL_RHS_LUT(lut, np.ascontiguousarray(y, dtype=np.float64))
+
+
+def _eval_rhs_lut(lut, y):
+    """Pure-Python body of eval_rhs_lut, compiled by numba on first call."""
+    dydt = np.empty(lut.shape[0])
+    for i in range(lut.shape[0]):
+        row = lut[i]
+        f = row["kprod"]
+        for j in range(row["n_regs"]):
+            x = y[row["reg_src"][j]]
+            x_n = x * x
+            kn = row["reg_kn"][j]
+            if row["reg_type"][j] == _REPRESSOR_ID or row["reg_type"][j] == _INHIBITOR_ID:
+                f *= kn / (kn + x_n)
+            else:
+                f *= x_n / (kn + x_n)
+        dydt[i] = f - row["deg"] * y[i]
+    return dydt
+
+
+# numba.typed.Dict mirror of the regulator entries for @njit consumers, which
+# cannot take the Python dict without reflection. Built on first use.
+_NUMBA_TABLE = None
+
+
+def get_numba_table():
+    """Return a numba typed Dict: regulator name -> [K, n, Kn, is_floating].
+
+    K is the entry's Kr or Ka. Requires numba.
+    """
+    global _NUMBA_TABLE
+    if _NUMBA_TABLE is None:
+        if _load_njit() is None:
+            raise ImportError("get_numba_table() requires numba")
+        from numba import types
+        from numba.typed import Dict
+
+        table = Dict.empty(key_type=types.unicode_type, value_type=types.float64[::1])
+        K = np.where(np.isnan(KR), KA, KR)
+        for name, i in NAME_TO_IDX.items():
+            if not np.isnan(K[i]):
+                table[name] = np.array([K[i], N_HILL[i], KN[i], IS_FLOATING[i]], dtype=np.float64)
+        _NUMBA_TABLE = table
+    return _NUMBA_TABLE
@@ -0,0 +1,37 @@
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("flask_cors")
+
+import app  # noqa: E402
+import constants  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+def test_api_constants_omits_derived_keys(client):
+    response = client.get("/api/constants")
+    assert response.status_code == 200
+    table = response.get_json()
+    assert set(table) == set(constants.COMPONENT_CONSTANTS)
+    for params in table.values():
+        assert not constants.DERIVED_KEYS & set(params)
+
+
+def test_api_constants_serves_original_values(client):
+    baseline = json.loads((Path(__file__).parent / "data" / "component_constants_baseline.json").read_text())
+    assert client.get("/api/constants").get_json() == baseline
+
+
+def test_editable_constants_are_independent_copies():
+    first = app.editable_constants()
+    first["repressor_2_start"]["Kr"] = 9.0
+    assert app.editable_constants()["repressor_2_start"]["Kr"] == 0.1
+    assert first["repressor_2_end"]["Kr"] == 0.1
+    assert constants.COMPONENT_CONSTANTS["repressor_2_start"]["Kr"] == 0.1
@@ -0,0 +1,231 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import constants
+
+# Three species in a ring with mixed regulation: repressors, an activator,
+# an inhibitor and a floating inducer held at its table concentration.
+MIXED_TOPOLOGY = [
+    {
+        "promoter": "promoter_1",
+        "rbs": "rbs_1",
+        "cds": "cds_1",
+        "terminator": "terminator_1",
+        "regulators": [("repressor_2_start", 2), ("floating_inducer_a", None)],
+    },
+    {
+        "promoter": "promoter_2",
+        "rbs": "rbs_2",
+        "cds": "cds_2",
+        "regulators": [("repressor_3_start", 0), ("activator_1_start", 2)],
+    },
+    {
+        "promoter": "promoter_3",
+        "rbs": "rbs_3",
+        "cds": "cds_3",
+        "terminator": "terminator_3",
+        "regulators": [("inhibitor_1_end", 1)],
+    },
+]
+STATES = [np.array([0.1, 0.2, 0.3]), np.array([0.0, 5.0, 34.65]), np.array([120.0, 0.05, 1.0])]
+
+
+@pytest.fixture(autouse=True)
+def isolated_rhs_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("MAGIC_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(constants, "_RHS_CACHE", {})
+
+
+def test_component_table_matches_baseline():
+    # The original hand-written table, before the builder loops replaced it.
+    baseline = json.loads((Path(__file__).parent / "data" / "component_constants_baseline.json").read_text())
+    table = {
+        name: {key: value for key, value in params.items() if key not in constants.DERIVED_KEYS}
+        for name, params in constants.COMPONENT_CONSTANTS.items()
+    }
+    assert list(table) == list(baseline)
+    assert table == baseline
+
+
+@pytest.mark.parametrize("name, kr", [
+    ("repressor_1_start", 0.5), ("repressor_2_start", 0.1), ("repressor_2_end", 0.1),
+    ("repressor_3_start", 0.4), ("repressor_3_end", 0.4), ("repressor_15_end", 0.5),
+])
+def test_repressor_kr_overrides(name, kr):
+    assert constants.COMPONENT_CONSTANTS[name]["Kr"] == kr
+    assert constants.KR[constants.NAME_TO_IDX[name]] == kr
+
+
+@pytest.mark.parametrize("name", [f"floating_{kind}_{letter}" for kind in ("inhibitor", "inducer") for letter in "abc"])
+def test_floating_entries(name):
+    params = constants.COMPONENT_CONSTANTS[name]
+    assert params["is_floating"] is True
+    assert params["concentration"] == 1.0
+    assert params.get("Kr", params.get("Ka")) == 0.5
+
+
+def test_regulators_carry_precomputed_kn():
+    for name, params in constants.COMPONENT_CONSTANTS.items():
+        K = params.get("Kr", params.get("Ka"))
+        if K is None:
+            assert "Kn" not in params
+        else:
+            assert params["Kn"] == K ** params["n"]
+            assert constants.KN[constants.NAME_TO_IDX[name]] == params["Kn"]
+
+
+def test_sampled_parameters_stay_in_range():
+    samples = constants.sample_parameters(np.random.default_rng(0), 20000)
+    assert samples.shape == (20000, len(constants.PARAM_NAMES))
+    assert np.all(samples >= constants.PARAM_LO) and np.all(samples <= constants.PARAM_HI)
+
+
+def test_log_scale_parameters_are_spread_in_log_space():
+    samples = constants.sample_parameters(np.random.default_rng(0), 20000)
+    # Uniform in log space puts the median at the geometric midpoint of the
+    # range; uniform in linear space puts it at the arithmetic midpoint.
+    geometric = np.sqrt(constants.PARAM_LO * constants.PARAM_HI)
+    arithmetic = (constants.PARAM_LO + constants.PARAM_HI) / 2
+    midpoint = np.where(constants.PARAM_IS_LOGSCALE, geometric, arithmetic)
+    np.testing.assert_allclose(np.mean(samples < midpoint, axis=0), 0.5, atol=0.02)
+    assert constants.PARAM_IS_LOGSCALE[constants.PARAM_IDX["degradation_rate"]]
+    assert constants.PARAM_IS_LOGSCALE[constants.PARAM_IDX["binding_affinity"]]
+
+
+@pytest.mark.parametrize("y", STATES)
+def test_generated_and_table_rhs_agree(y):
+    rhs = constants.build_rhs(MIXED_TOPOLOGY)
+    lut = constants.build_rhs_lut(MIXED_TOPOLOGY)
+    np.testing.assert_allclose(rhs(0.0, y), constants.eval_rhs_lut(lut, y), rtol=1e-12)
+
+
+@pytest.mark.parametrize("y", STATES)
+def test_pure_python_rhs_paths_agree(y):
+    rhs = constants._exec_rhs(MIXED_TOPOLOGY)
+    lut = constants.build_rhs_lut(MIXED_TOPOLOGY)
+    np.testing.assert_allclose(rhs(0.0, y), constants._eval_rhs_lut(lut, y), rtol=1e-12)
+
+
+@pytest.mark.parametrize("y", [STATES[1].astype(np.float32), np.array([0, 5, 2]), [0.0, 5.0, 34.65]])
+def test_rhs_paths_accept_any_numeric_state(y, monkeypatch):
+    expected = constants._exec_rhs(MIXED_TOPOLOGY)(0.0, np.asarray(y, dtype=np.float64))
+    lut = constants.build_rhs_lut(MIXED_TOPOLOGY)
+    np.testing.assert_allclose(constants.build_rhs(MIXED_TOPOLOGY)(0, y), expected, rtol=1e-12)
+    np.testing.assert_allclose(constants.eval_rhs_lut(lut, y), expected, rtol=1e-12)
+
+    monkeypatch.setattr(constants, "_RHS_CACHE", {})
+    monkeypatch.setattr(constants, "_load_njit", lambda: None)
+    np.testing.assert_allclose(constants.build_rhs(MIXED_TOPOLOGY)(0, y), expected, rtol=1e-12)
+
+
+def test_rhs_lut_rows_are_cache_line_aligned():
+    lut = constants.build_rhs_lut(MIXED_TOPOLOGY)
+    assert lut.dtype.itemsize == 64
+    assert lut.ctypes.data % 64 == 0
+    assert lut.flags["C_CONTIGUOUS"]
+
+
+@pytest.mark.parametrize("source", [0.5, "0", 3, -1])
+def test_invalid_regulator_source_is_rejected(source):
+    topology = [{"promoter": "promoter_1", "rbs": "rbs_1", "cds": "cds_1",
+                 "regulators": [("repressor_1_start", source)]}]
+    with pytest.raises(ValueError):
+        constants.build_rhs(topology)
+    with pytest.raises(ValueError):
+        constants.build_rhs_lut(topology)
+    assert not constants._RHS_CACHE
+
+
+@pytest.mark.parametrize("species", [
+    {"promoter": "promoter_1", "rbs": "rbs_1"},
+    {"rbs": "rbs_1", "cds": "cds_1"},
+    {"promoter": "promoter_1", "rbs": "rbs_1", "cds": "cds_1", "regulators": [(3, 0)]},
+    {"promoter": "promoter_1", "rbs": "rbs_1", "cds": "cds_1", "regulators": [(["repressor_1_start"], 0)]},
+    {"promoter": "promoter_1", "rbs": "rbs_1", "cds": "cds_1", "terminator": 7},
+])
+def test_malformed_species_is_rejected(species):
+    with pytest.raises(ValueError):
+        constants.build_rhs([species])
+    with pytest.raises(ValueError):
+        constants.build_rhs_lut([species])
+    assert not constants._RHS_CACHE
+
+
+@pytest.mark.parametrize("lut, lut_idx", [
+    (constants.KR_HILL_LUT, constants.KR_LUT_IDX),
+    (constants.KA_HILL_LUT, constants.KA_LUT_IDX),
+])
+def test_hill_lut_relative_error_across_grid(lut, lut_idx):
+    # Midpoints in log space are where interpolation error peaks; the low end
+    # (x << K) is where a uniform grid broke down.
+    log_grid = np.log(constants.HILL_X_GRID)
+    x = np.exp((log_grid[:-1] + log_grid[1:]) / 2)
+    for i in np.flatnonzero(lut_idx >= 0):
+        k_n = constants.KN[i]
+        expected = x * x / (k_n + x * x)
+        np.testing.assert_allclose(np.interp(np.log(x), log_grid, lut[lut_idx[i]]), expected, rtol=1e-4)
+        np.testing.assert_allclose(lut[lut_idx[i]][0], constants.HILL_X_MIN ** 2 / k_n, rtol=1e-5)
+
+
+def test_rhs_disk_cache_is_reused(tmp_path):
+    pytest.importorskip("numba")
+    y = STATES[0]
+    rhs = constants.build_rhs(MIXED_TOPOLOGY)
+    assert sum(rhs.compiled.stats.cache_misses.values()) == 1
+    cache_dir = tmp_path / f"rhs_{constants.CONSTANTS_HASH}"
+    cached = list(cache_dir.glob("rhs_*.py"))
+    assert len(cached) == 1
+    assert cached[0].stem not in sys.modules
+
+    # A fresh process must load the compiled code instead of recompiling.
+    script = (
+        "import json, sys, numpy as np, constants\n"
+        "rhs = constants.build_rhs(json.loads(sys.argv[1]))\n"
+        "stats = rhs.compiled.stats\n"
+        "print(json.dumps([sum(stats.cache_hits.values()), sum(stats.cache_misses.values()),"
+        " rhs(0.0, np.array(json.loads(sys.argv[2]))).tolist()]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script, json.dumps(MIXED_TOPOLOGY), json.dumps(y.tolist())],
+        cwd=Path(constants.__file__).parent,
+        env={**os.environ, "MAGIC_CACHE_DIR": str(tmp_path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    hits, misses, dydt = json.loads(result.stdout.splitlines()[-1])
+    assert (hits, misses) == (1, 0)
+    np.testing.assert_array_equal(dydt, rhs(0.0, y))
+    assert list(cache_dir.glob("rhs_*.py")) == cached
+
+
+def test_numba_table_rows_mirror_regulators():
+    pytest.importorskip("numba")
+    table = constants.get_numba_table()
+    regulators = {
+        name: params for name, params in constants.COMPONENT_CONSTANTS.items() if "Kn" in params
+    }
+    assert set(table.keys()) == set(regulators)
+    for name, params in regulators.items():
+        expected = [params.get("Kr", params.get("Ka")), params["n"], params["Kn"], params["is_floating"]]
+        np.testing.assert_array_equal(table[name], np.array(expected, dtype=np.float64))
+
+
+def test_numba_table_requires_numba(monkeypatch):
+    monkeypatch.setattr(constants, "_NUMBA_TABLE", None)
+    monkeypatch.setattr(constants, "_load_njit", lambda: None)
+    with pytest.raises(ImportError):
+        constants.get_numba_table()
+
+
+def test_component_ids_match_name_index():
+    assert [member.name for member in constants.ComponentId] == list(constants.NAME_TO_IDX)
+    for name, i in constants.NAME_TO_IDX.items():
+        assert constants.ComponentId[name] == i
+    assert constants.KR[constants.ComponentId.repressor_2_start] == 0.1